@@ -1,6 +1,6 @@
 """A very simple and limited widget to display the current time."""
 
-from datetime import datetime, timezone
+from time import localtime, struct_time, time
 
 from textual.widgets import Static
 
@@ -8,14 +8,33 @@ from textual.widgets import Static
 class Clock(Static):
     """A very simple and limited widget to display the current time."""
 
+    def __init__(self) -> None:
+        """Initialize the clock."""
+
+        super().__init__()
+        self._last_time: str = ""
+
     def on_mount(self) -> None:
         """Event handler called when widget is added to the app."""
 
         # TODO Make the time display configurable through the config file (24h v. AM/PM)
-        # TODO Make the clock update on the system's second change
-        self.set_interval(
-            1,
-            lambda: self.update(
-                datetime.now(timezone.utc).astimezone().time().strftime("%H:%M:%S")
-            ),
-        )
+        self._update_time()
+
+        # Align the updates with the system's second change
+        self.set_timer(1.0 - (time() % 1.0), self._start_ticking)
+
+    def _start_ticking(self) -> None:
+        """Update the time and start the regular, once per second, updates."""
+
+        self._update_time()
+        self.set_interval(1.0, self._update_time)
+
+    def _update_time(self) -> None:
+        """Update the displayed time, if it has changed."""
+
+        now: struct_time = localtime()
+        current_time: str = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        if current_time == self._last_time:
+            return
+        self._last_time = current_time
+        self.update(current_time)
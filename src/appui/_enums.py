@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TypeVar
+from functools import cache
+from typing import Any, TypeVar, cast
 
 
 class Justify(Enum):
@@ -32,6 +33,24 @@ T = TypeVar("T", bound=Enum)
 U = TypeVar("U", str, int, float)
 
 
+@cache
+def _get_members_by_value(enum_type: type[Enum]) -> dict[Any, Enum]:
+    """
+    Get the members of an enum, keyed by their values.
+
+    Note:
+        The result is computed once per enum type, then cached.
+
+    Args:
+        enum_type (type[Enum]): The enum type.
+
+    Returns:
+        dict[Any, Enum]: The members of the enum, keyed by their values.
+    """
+
+    return {member.value: member for member in enum_type}
+
+
 def get_enum_member(enum_type: type[T], value: U | None) -> T:
     """
     Get the enum member for a given string value.
@@ -47,8 +66,8 @@ def get_enum_member(enum_type: type[T], value: U | None) -> T:
         T: The enum member.
     """
 
-    for member in enum_type:
-        if member.value == value:
-            return member
-    error_msg = f"Value '{value}' is not a valid member of {enum_type.__name__}"
-    raise ValueError(error_msg)
+    try:
+        return cast("T", _get_members_by_value(enum_type)[value])
+    except (KeyError, TypeError):
+        error_msg = f"Value '{value}' is not a valid member of {enum_type.__name__}"
+        raise ValueError(error_msg) from None
@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final
 
 _NO_VALUE: Final[str] = "N/A"  # TODO Maybe use "" instead?
 
+# Quotes often keep the same values from one refresh to the next, so the formatted
+# strings are cached. The size should comfortably hold every numeric cell of a table.
+_CACHE_SIZE: Final[int] = 1024
+
+# Divisors and suffixes for the compact representation, indexed by order of magnitude
+_COMPACT_DIVISORS: Final[tuple[int, ...]] = (
+    1,
+    1_000,
+    1_000_000,
+    1_000_000_000,
+    1_000_000_000_000,
+)
+_COMPACT_SUFFIXES: Final[tuple[str, ...]] = ("", "K", "M", "B", "T")
+_COMPACT_MAX_MAGNITUDE: Final[int] = len(_COMPACT_DIVISORS) - 1
+
 
 def as_percent(value: float | None) -> str:
     """
@@ -21,6 +37,24 @@ def as_percent(value: float | None) -> str:
 
     if value is None:
         return _NO_VALUE
+    if value == 0:
+        # 0.0 and -0.0 are the same key to the cache, but aren't formatted the same
+        return _format_percent.__wrapped__(value)
+    return _format_percent(value)
+
+
+@lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _format_percent(value: float) -> str:
+    """
+    Format a value as a percentage. See `as_percent`.
+
+    Args:
+        value (float): The value to be formatted as a percentage.
+
+    Returns:
+        str: The percentage representation of the value.
+    """
+
     return f"{value:.2f}%"
 
 
@@ -40,6 +74,25 @@ def as_float(value: float | None, precision: int = 2) -> str:
 
     if value is None:
         return _NO_VALUE
+    if value == 0:
+        # 0.0 and -0.0 are the same key to the cache, but aren't formatted the same
+        return _format_float.__wrapped__(value, precision)
+    return _format_float(value, precision)
+
+
+@lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _format_float(value: float, precision: int) -> str:
+    """
+    Format a value as a float. See `as_float`.
+
+    Args:
+        value (float): The value to be formatted as a float.
+        precision (int): The number of decimal places to include.
+
+    Returns:
+        str: The float representation of the value.
+    """
+
     return f"{value:.{precision}f}"
 
 
@@ -65,13 +118,28 @@ def as_compact(value: int | None) -> str:
 
     if value is None:
         return _NO_VALUE
-    if value < 1000:  # noqa: PLR2004
+    return _format_compact(value)
+
+
+@lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _format_compact(value: int) -> str:
+    """
+    Format a value as a compact string. See `as_compact`.
+
+    Args:
+        value (int): The value to be formatted.
+
+    Returns:
+        str: The compact representation of the value.
+    """
+
+    if value < _COMPACT_DIVISORS[1]:
         return str(value)
-    if value < 1000000:  # noqa: PLR2004
-        return f"{value / 1000:.2f}K"
-    if value < 1000000000:  # noqa: PLR2004
-        return f"{value / 1000000:.2f}M"
-    if value < 1000000000000:  # noqa: PLR2004
-        return f"{value / 1000000000:.2f}B"
-
-    return f"{value / 1000000000000:.2f}T"
+
+    # As 2**10 is just above 10**3, the bit length gives the magnitude of the value,
+    # or one less than it.
+    magnitude: int = min((value.bit_length() - 1) // 10, _COMPACT_MAX_MAGNITUDE)
+    if magnitude < _COMPACT_MAX_MAGNITUDE and value >= _COMPACT_DIVISORS[magnitude + 1]:
+        magnitude += 1
+
+    return f"{value / _COMPACT_DIVISORS[magnitude]:.2f}{_COMPACT_SUFFIXES[magnitude]}"
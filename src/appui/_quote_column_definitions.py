@@ -3,47 +3,76 @@
 from __future__ import annotations
 
 from math import inf
-from typing import Final, TypeVar
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Final, TypeVar
 
 from ._enums import Justify
 from ._formatting import as_compact, as_float, as_percent
 from ._quote_table_data import QuoteColumn
 
+if TYPE_CHECKING:
+    from yfinance import YQuote
+
 T = TypeVar("T", int, float)
 """TypeVar T is defined to be either an int or a float."""
 
 
-def _safe_value(v: T | None) -> float:
+def _sign(v: T) -> int:
+    """
+    Determine the sign of a given value.
+
+    Args:
+        v (T): The value for which the sign is to be determined.
+
+    Returns:
+        int: Returns 1 if the value is greater than 0, -1 if less than 0, and 0 if the
+            value is exactly 0.
     """
-    Safely retrieves the value of v.
 
-    Note:
-        If v is None, it returns the smallest representable value for type T.
+    return (v > 0) - (v < 0)
+
+
+def _price_formatter(attribute: str) -> Callable[[YQuote], str]:
+    """
+    Build the format function for a price attribute of a quote.
+
+    The price and the quote's price hint are fetched together, in a single call, and
+    the price is formatted with the precision given by the hint.
 
     Args:
-        v (T | None): The value to be retrieved. Can be of type int or float.
+        attribute (str): The name of the price attribute of the quote.
 
     Returns:
-        float: The value of v if it's not None, otherwise the smallest representable
-            value for type T.
+        Callable[[YQuote], str]: The format function for the price attribute.
     """
 
-    return -inf if v is None else v
+    get_price_and_hint = attrgetter(attribute, "price_hint")
+    return lambda q: as_float(*get_price_and_hint(q))
 
 
-def _sign(v: T) -> int:
+def _sort_key(attribute: str) -> Callable[[YQuote], tuple[float, str]]:
     """
-    Determine the sign of a given value.
+    Build the sort key function for an attribute of a quote.
+
+    The value and the quote's symbol are fetched together, in a single call. Missing
+    values sort as the smallest representable value, and ties are broken by the
+    symbol.
 
     Args:
-        v (T): The value for which the sign is to be determined.
+        attribute (str): The name of the attribute of the quote to sort by.
 
     Returns:
-        int: Returns 1 if the value is greater than 0, -1 if less than 0, and 0 if the
-            value is exactly 0.
+        Callable[[YQuote], tuple[float, str]]: The sort key function for the
+            attribute.
     """
 
-    return 1 if v > 0 else -1 if v < 0 else 0
+    get_value_and_symbol = attrgetter(attribute, "symbol")
+
+    def sort_key(q: YQuote) -> tuple[float, str]:
+        value, symbol = get_value_and_symbol(q)
+        return (-inf if value is None else value, symbol.lower())
+
+    return sort_key
 
 
 ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
@@ -62,8 +91,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "Last",
             10,
             "last",
-            lambda q: as_float(q.regular_market_price, q.price_hint),
-            lambda q: (q.regular_market_price, q.symbol.lower()),
+            _price_formatter("regular_market_price"),
+            _sort_key("regular_market_price"),
         )
     ),
     "change": (
@@ -71,8 +100,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "Change",
             10,
             "change",
-            lambda q: as_float(q.regular_market_change, q.price_hint),
-            lambda q: (q.regular_market_change, q.symbol.lower()),
+            _price_formatter("regular_market_change"),
+            _sort_key("regular_market_change"),
             lambda q: _sign(q.regular_market_change),
         )
     ),
@@ -82,7 +111,7 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             8,
             "change_percent",
             lambda q: as_percent(q.regular_market_change_percent),
-            lambda q: (q.regular_market_change_percent, q.symbol.lower()),
+            _sort_key("regular_market_change_percent"),
             lambda q: _sign(q.regular_market_change_percent),
         )
     ),
@@ -91,8 +120,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "Open",
             10,
             "open",
-            lambda q: as_float(q.regular_market_open, q.price_hint),
-            lambda q: (_safe_value(q.regular_market_open), q.symbol.lower()),
+            _price_formatter("regular_market_open"),
+            _sort_key("regular_market_open"),
         )
     ),
     "low": (
@@ -100,8 +129,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "Low",
             10,
             "low",
-            lambda q: as_float(q.regular_market_day_low, q.price_hint),
-            lambda q: (_safe_value(q.regular_market_day_low), q.symbol.lower()),
+            _price_formatter("regular_market_day_low"),
+            _sort_key("regular_market_day_low"),
         )
     ),
     "high": (
@@ -109,8 +138,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "High",
             10,
             "high",
-            lambda q: as_float(q.regular_market_day_high, q.price_hint),
-            lambda q: (_safe_value(q.regular_market_day_high), q.symbol.lower()),
+            _price_formatter("regular_market_day_high"),
+            _sort_key("regular_market_day_high"),
         )
     ),
     "52w_low": (
@@ -118,8 +147,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "52w Low",
             10,
             "52w_low",
-            lambda q: as_float(q.fifty_two_week_low, q.price_hint),
-            lambda q: (q.fifty_two_week_low, q.symbol.lower()),
+            _price_formatter("fifty_two_week_low"),
+            _sort_key("fifty_two_week_low"),
         )
     ),
     "52w_high": (
@@ -127,8 +156,8 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             "52w High",
             10,
             "52w_high",
-            lambda q: as_float(q.fifty_two_week_high, q.price_hint),
-            lambda q: (q.fifty_two_week_high, q.symbol.lower()),
+            _price_formatter("fifty_two_week_high"),
+            _sort_key("fifty_two_week_high"),
         )
     ),
     "volume": (
@@ -137,7 +166,7 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             10,
             "volume",
             lambda q: as_compact(q.regular_market_volume),
-            lambda q: (_safe_value(q.regular_market_volume), q.symbol.lower()),
+            _sort_key("regular_market_volume"),
         )
     ),
     "avg_volume": (
@@ -146,7 +175,7 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             10,
             "avg_volume",
             lambda q: as_compact(q.average_daily_volume_3_month),
-            lambda q: (_safe_value(q.average_daily_volume_3_month), q.symbol.lower()),
+            _sort_key("average_daily_volume_3_month"),
         )
     ),
     "pe": (
@@ -155,7 +184,7 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             6,
             "pe",
             lambda q: as_float(q.trailing_pe),
-            lambda q: (_safe_value(q.trailing_pe), q.symbol.lower()),
+            _sort_key("trailing_pe"),
         )
     ),
     "dividend": (
@@ -164,7 +193,7 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             6,
             "dividend",
             lambda q: as_float(q.dividend_yield),
-            lambda q: (_safe_value(q.dividend_yield), q.symbol.lower()),
+            _sort_key("dividend_yield"),
         )
     ),
     "market_cap": (
@@ -173,7 +202,7 @@ ALL_QUOTE_COLUMNS: Final[dict[str, QuoteColumn]] = {
             10,
             "market_cap",
             lambda q: as_compact(q.market_cap),
-            lambda q: (_safe_value(q.market_cap), q.symbol.lower()),
+            _sort_key("market_cap"),
         )
     ),
 }
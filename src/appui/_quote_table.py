@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import sys
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Final
 
 from rich.text import Text
@@ -38,6 +39,13 @@ class QuoteTable(DataTable[Text]):
     _GAINING_COLOR: Final[str] = "#00DD00"
     _LOSING_COLOR: Final[str] = "#DD0000"
 
+    # The style of a cell, indexed by its sign + 1
+    _SIGN_STYLES: Final[tuple[str, str, str]] = (_LOSING_COLOR, "", _GAINING_COLOR)
+
+    # Number of styled cells to keep around. Should comfortably hold all the cells of
+    # the table.
+    _STYLED_CELLS_CACHE_SIZE: Final[int] = 4096
+
     class BindingsChanged(Message):
         """A message sent when the bindings have changed."""
 
@@ -53,6 +61,16 @@ class QuoteTable(DataTable[Text]):
         self._state: QuoteTableState = state
         self._version: int
         self._column_key_map: dict[str, Any] = {}
+        self._sort_state: tuple[str, SortDirection] | None = None
+        # What the header was last drawn with: the sort state (for the column titles),
+        # the hovered column and the bindings mode (for the highlight)
+        self._header_state: tuple[Any, ...] = ()
+        # The cells currently displayed, for each row key
+        self._rendered_cells: dict[str, tuple[QuoteCell, ...]] = {}
+        # The row keys, by row index. Grown as needed when the table gets larger
+        self._row_keys: list[str] = []
+        # Whether extra rows are being removed from the table
+        self._removing_rows: bool = False
 
         # Bindings
         self._bindings_modes: dict[QuoteTable.BM, BindingsMap] = {
@@ -100,10 +118,6 @@ class QuoteTable(DataTable[Text]):
         self.zebra_stripes = True
         self.cursor_foreground_priority = "renderable"
 
-    def __del__(self) -> None:
-        # Make sure the query thread is stopped
-        self._state.query_thread_running = False
-
     @override
     def on_mount(self) -> None:
         super().on_mount()
@@ -114,6 +128,7 @@ class QuoteTable(DataTable[Text]):
                 styled_column, width=quote_column.width, key=quote_column.key
             )
             self._column_key_map[quote_column.key] = key
+        self._sort_state = (self._state.sort_column_key, self._state.sort_direction)
 
         self.set_interval(0.1, self._update_table)
         self.fixed_columns = 1
@@ -124,7 +139,7 @@ class QuoteTable(DataTable[Text]):
 
     @override
     def _on_unmount(self) -> None:
-        self._state.query_thread_running = False
+        self._state.close()
         super()._on_unmount()
 
     def _switch_bindings(self, mode: QuoteTable.BM) -> None:
@@ -139,58 +154,135 @@ class QuoteTable(DataTable[Text]):
     def _update_table(self) -> None:  # noqa: PLR0912 FIXME
         """Update the table with the latest quotes (if any)."""
 
-        if self._version == self._state.version:
+        # Read the version first: if the state changes while the table is being
+        # updated, the next update will pick the changes up
+        version: int = self._state.version
+        if self._version == version:
             return
 
-        # Set the column titles, including the sort arrow if needed
-        quote_column: QuoteColumn
-        for quote_column in self._state.quotes_columns:
-            styled_column: Text = self._get_styled_column_title(quote_column)
-            self.columns[self._column_key_map[quote_column.key]].label = styled_column
-
-        quotes: list[QuoteRow] = self._state.quotes_rows
-
-        if len(quotes) > 0:
-            if self._current_bindings == QuoteTable.BM.DEFAULT:
-                self._switch_bindings(QuoteTable.BM.WITH_DELETE)
-        else:  # noqa: PLR5501
-            if self._current_bindings == QuoteTable.BM.WITH_DELETE:
-                self._switch_bindings(QuoteTable.BM.DEFAULT)
-
-        i: int = 0
-        quote: QuoteRow
-        for i, quote in enumerate(quotes):
-            # We only use the index as the row key, so we can update and reorder the
-            # rows as needed
-            quote_key: str = str(i)
-            # Update existing rows
-            if quote_key in self.rows:  # pyright: ignore [reportUnnecessaryContains]
-                for j, cell in enumerate(quote.values):
-                    self.update_cell(
-                        quote_key,
-                        self._state.quotes_columns[j].key,
-                        QuoteTable._get_styled_cell(cell),
-                    )
+        # Make all the changes to the table before repainting it
+        with self.app.batch_update():
+            # Set the column titles, including the sort arrow if needed. This is only
+            # required when the sort column or direction have changed.
+            sort_state: tuple[str, SortDirection] = (
+                self._state.sort_column_key,
+                self._state.sort_direction,
+            )
+            if sort_state != self._sort_state:
+                quote_column: QuoteColumn
+                for quote_column in self._state.quotes_columns:
+                    styled_column: Text = self._get_styled_column_title(quote_column)
+                    self.columns[
+                        self._column_key_map[quote_column.key]
+                    ].label = styled_column
+                self._sort_state = sort_state
+
+            quotes: list[QuoteRow] = self._state.quotes_rows
+
+            if len(quotes) > 0:
+                if self._current_bindings == QuoteTable.BM.DEFAULT:
+                    self._switch_bindings(QuoteTable.BM.WITH_DELETE)
+            else:  # noqa: PLR5501
+                if self._current_bindings == QuoteTable.BM.WITH_DELETE:
+                    self._switch_bindings(QuoteTable.BM.DEFAULT)
+
+            # Bind the lookups used in the loop below to locals, as they are repeated
+            # for every cell of every row
+            column_keys: list[str] = self._state.column_keys
+            rendered_cells_by_key: dict[str, tuple[QuoteCell, ...]] = (
+                self._rendered_cells
+            )
+            update_cell = self.update_cell
+            get_styled_cell = QuoteTable._get_styled_cell
+
+            row_keys: list[str] = self._row_keys
+            if len(quotes) > len(row_keys):
+                row_keys.extend(str(k) for k in range(len(row_keys), len(quotes)))
+
+            # The rows are keyed by their index, so the first row_count quotes already
+            # have a row in the table
+            row_count: int = self.row_count
+
+            quote: QuoteRow
+            for i, quote in enumerate(quotes):
+                # We only use the index as the row key, so we can update and reorder the
+                # rows as needed
+                quote_key: str = row_keys[i]
+                # Update existing rows, only touching the cells that have changed
+                if i < row_count:
+                    rendered_cells: tuple[QuoteCell, ...] = rendered_cells_by_key[
+                        quote_key
+                    ]
+                    # Most rows don't change between two updates: skip them as a whole
+                    if quote.values == rendered_cells:
+                        continue
+                    for j, cell in enumerate(quote.values):
+                        if cell == rendered_cells[j]:
+                            continue
+                        update_cell(quote_key, column_keys[j], get_styled_cell(cell))
+                else:
+                    # Add new rows, if any
+                    self.add_row(*map(get_styled_cell, quote.values), key=quote_key)
+                rendered_cells_by_key[quote_key] = quote.values
+
+            # Remove extra rows, if any
+            self._remove_rows(row_keys[len(quotes) : row_count])
+
+            current_row: int = self._state.cursor_row
+            if current_row >= 0:
+                if self.cursor_type == "none":
+                    self.cursor_type = "row"
+                self.move_cursor(row=current_row)
             else:
-                # Add new rows, if any
-                stylized_row: list[Text] = [
-                    QuoteTable._get_styled_cell(cell) for cell in quote.values
-                ]
-                self.add_row(*stylized_row, key=quote_key)
-
-        # Remove extra rows, if any
-        for r in range(i, len(self.rows)):
-            self.remove_row(row_key=str(r))
-
-        current_row: int = self._state.cursor_row
-        if current_row >= 0:
-            if self.cursor_type == "none":
-                self.cursor_type = "row"
-            self.move_cursor(row=current_row)
-        else:
-            self.cursor_type = "none"
+                self.cursor_type = "none"
 
-        self._version = self._state.version
+        self._refresh_header()
+
+        self._version = version
+
+    def _remove_rows(self, row_keys: list[str]) -> None:
+        """
+        Remove rows from the table, repainting it only once all are removed.
+
+        Removing rows moves the cursor back within the table. This must not be
+        mirrored to the state, as its cursor is restored once the table is updated.
+
+        Args:
+            row_keys (list[str]): The keys of the rows to remove.
+        """
+
+        if not row_keys:
+            return
+
+        self._removing_rows = True
+        try:
+            with self.app.batch_update():
+                for row_key in row_keys:
+                    self.remove_row(row_key=row_key)
+                    self._rendered_cells.pop(row_key, None)
+        finally:
+            self._removing_rows = False
+
+    def _refresh_header(self) -> None:
+        """
+        Repaint the header, if what it shows has changed since it was last drawn.
+
+        Changing the column titles or the hovered column doesn't invalidate the render
+        caches of the table, so it would otherwise keep showing the old header until
+        some cell changes.
+        """
+
+        header_state: tuple[Any, ...] = (
+            self._sort_state,
+            self._state.hovered_column,
+            self._current_bindings,
+        )
+        if header_state == self._header_state:
+            return
+
+        self._header_state = header_state
+        self._clear_caches()
+        self.refresh()
 
     def _get_styled_column_title(self, quote_column: QuoteColumn) -> Text:
         """
@@ -233,19 +325,33 @@ class QuoteTable(DataTable[Text]):
         Args:
             cell (QuoteCell): The quote cell for which to generate a styled cell.
 
+        Note:
+            The styled cells are cached and shared. They must not be modified.
+
         Returns:
             Text: The styled cell.
         """
 
+        return QuoteTable._get_styled_text(cell.value, cell.sign, cell.justify)
+
+    @staticmethod
+    @lru_cache(maxsize=_STYLED_CELLS_CACHE_SIZE)
+    def _get_styled_text(value: str, sign: int, justify: Justify) -> Text:
+        """
+        Generate the styled text for a cell value.
+
+        Args:
+            value (str): The value of the cell.
+            sign (int): The sign of the value; -1, 0 or 1.
+            justify (Justify): The justification of the value.
+
+        Returns:
+            Text: The styled text.
+        """
+
         return Text(
-            cell.value,
-            justify=cell.justify.value,
-            style=(
-                QuoteTable._LOSING_COLOR
-                if cell.sign == -1
-                else QuoteTable._GAINING_COLOR if cell.sign > 0 else ""
-            ),
-        )  # fmt: skip
+            value, justify=justify.value, style=QuoteTable._SIGN_STYLES[sign + 1]
+        )
 
     @override
     def watch_hover_coordinate(self, old: Coordinate, value: Coordinate) -> None:
@@ -300,7 +406,8 @@ class QuoteTable(DataTable[Text]):
         self, old_coordinate: Coordinate, new_coordinate: Coordinate
     ) -> None:
         super().watch_cursor_coordinate(old_coordinate, new_coordinate)
-        self._state.cursor_row = new_coordinate.row
+        if not self._removing_rows:
+            self._state.cursor_row = new_coordinate.row
 
     def on_data_table_header_selected(self, evt: DataTable.HeaderSelected) -> None:
         """Event handler called when the header is clicked."""
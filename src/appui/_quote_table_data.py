@@ -7,6 +7,7 @@ building blocks of a quote table's structure and behavior.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -15,8 +16,28 @@ from ._enums import Justify
 if TYPE_CHECKING:
     from yfinance import YQuote
 
+# Slotted dataclasses are only available from Python 3.10 onward
+if sys.version_info >= (3, 10):
+    _SLOTS: dict[str, bool] = {"slots": True}
+else:
+    _SLOTS: dict[str, bool] = {}
 
-@dataclass(frozen=True)
+
+def neutral_sign(_: YQuote) -> int:
+    """
+    Sign indicator function for the columns whose values have no meaningful sign.
+
+    Args:
+        _ (YQuote): The quote. Unused.
+
+    Returns:
+        int: Always 0 (neutral).
+    """
+
+    return 0
+
+
+@dataclass(frozen=True, **_SLOTS)
 class QuoteCell:
     """Definition of a cell for the quote table."""
 
@@ -30,18 +51,18 @@ class QuoteCell:
     """The justification of the text in the cell."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class QuoteRow:
     """Definition of row for the quote table."""
 
     key: str
     """The key of the row."""
 
-    values: list[QuoteCell]
+    values: tuple[QuoteCell, ...]
     """The values of the row."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class QuoteColumn:
     """
     Represents a quote table column and defines its display properties and behaviors.
@@ -65,11 +86,11 @@ class QuoteColumn:
     sort_key_func: Callable[[YQuote], Any]
     """The function used provide the sort key for the column."""
 
-    sign_indicator_func: Callable[[YQuote], int] = lambda _: 0
+    sign_indicator_func: Callable[[YQuote], int] = neutral_sign
     """
     The function used to provide the sign indicator for the column.
 
-    Defaults to a function that returns 0 (neutral).
+    Defaults to neutral_sign, which always returns 0 (neutral).
     """
 
     justification: Justify = Justify.RIGHT
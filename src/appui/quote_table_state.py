@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import logging
-from threading import Lock, Thread
-from time import monotonic, sleep
+import sys
+from threading import Event, Lock, Thread
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Callable, Final
 
-from ._enums import SortDirection, get_enum_member
+from ._enums import Justify, SortDirection, get_enum_member
 from ._quote_column_definitions import ALL_QUOTE_COLUMNS
-from ._quote_table_data import QuoteCell, QuoteColumn, QuoteRow
+from ._quote_table_data import QuoteCell, QuoteColumn, QuoteRow, neutral_sign
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from yfinance import YFinance, YQuote
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 
-class QuoteTableState:
+class QuoteTableState:  # noqa: PLR0904
     """The state of the quote table."""
 
     class QuoteLockError(RuntimeError):
@@ -49,13 +57,13 @@ class QuoteTableState:
     _TICKER_COLUMN_KEY: Final[str] = "ticker"
 
     # Default values
-    _DEFAULT_COLUMN_KEYS: Final[list[str]] = [
+    _DEFAULT_COLUMN_KEYS: Final[tuple[str, ...]] = (
         "last",
         "change_percent",
         "volume",
         "market_cap",
-    ]
-    _DEFAULT_QUOTES: Final[list[str]] = [
+    )
+    _DEFAULT_QUOTES: Final[tuple[str, ...]] = (
         "AAPL",
         "F",
         "VT",
@@ -64,9 +72,16 @@ class QuoteTableState:
         "GC=F",
         "EURUSD=X",
         "BTC-USD",
-    ]
+    )
     _DEFAULT_SORT_DIRECTION: Final[SortDirection] = SortDirection.ASCENDING
     _DEFAULT_QUERY_FREQUENCY: Final[int] = 60
+    # How much to lengthen the query interval each time the quotes come back
+    # unchanged, and how long it can get, as a multiple of the query frequency
+    _QUERY_BACKOFF_FACTOR: Final[float] = 1.5
+    _MAX_QUERY_BACKOFF: Final[int] = 10
+    # How long to wait for the query thread to finish when stopping it. A query stuck
+    # on the network is left to finish on its own (daemon) thread after that.
+    _QUERY_THREAD_JOIN_TIMEOUT: Final[float] = 1.0
 
     # Config file keys
     _COLUMNS: Final[str] = "columns"
@@ -87,41 +102,75 @@ class QuoteTableState:
         """
 
         # Persistent state
-        self._quotes_symbols: list[str] = QuoteTableState._DEFAULT_QUOTES[:]
+        self._quotes_symbols: list[str] = list(QuoteTableState._DEFAULT_QUOTES)
         self._sort_column_key: str = QuoteTableState._TICKER_COLUMN_KEY
         self._sort_direction: SortDirection = QuoteTableState._DEFAULT_SORT_DIRECTION
         self._query_frequency: int = QuoteTableState._DEFAULT_QUERY_FREQUENCY
 
         # Ticker is *always* the first column
         columns_keys: list[str] = [
-            QuoteTableState._TICKER_COLUMN_KEY
-        ] + QuoteTableState._DEFAULT_COLUMN_KEYS[:]
+            QuoteTableState._TICKER_COLUMN_KEY,
+            *QuoteTableState._DEFAULT_COLUMN_KEYS,
+        ]
         self._columns: list[QuoteColumn] = [
             ALL_QUOTE_COLUMNS[column] for column in columns_keys
         ]
+        self._columns_formatters: tuple[
+            tuple[Callable[[YQuote], str], Callable[[YQuote], int] | None, Justify],
+            ...,
+        ] = ()
+        self._column_keys: list[str] = []
+        self._column_keys_set: set[str] = set()
+        self._refresh_columns_cache()
 
         # Transient state
         self._cursor_symbol: str = ""
         self._hovered_column: int = -1
         self._version: int = 0
         self._quotes: list[YQuote] = []
+        # The index of each quote in _quotes, by symbol
+        self._quotes_indices: dict[str, int] = {}
+        # The last rows built by quotes_rows, with the quotes and formatters they
+        # were built from
+        self._quotes_rows_cache: (
+            tuple[list[YQuote], tuple[Any, ...], list[QuoteRow]] | None
+        ) = None
         self._sort_key_func: Callable[[YQuote], Any] = ALL_QUOTE_COLUMNS[
             self._sort_column_key
         ].sort_key_func
 
         # Query thread
         self._query_thread_running: bool = False
-        self._query_thread: Thread = Thread(target=self._retrieve_quotes)
+        # A thread can only be started once, so a new one is created on each start
+        self._query_thread: Thread | None = None
+        # Set to wake the query thread up and stop it. Each thread gets its own event,
+        # so that a thread left behind when stopping can't be revived by a restart.
+        self._query_thread_stop: Event = Event()
+        # The time to wait between two queries, backed off from the query frequency
+        # while the quotes don't change
+        self._query_interval: float = self._query_frequency
+        self._last_quotes_signature: int | None = None
         self._last_query_time: float = monotonic()
 
         # Other
         self._yfin: YFinance = yfin
         self._quotes_lock = Lock()
 
-    def __del__(self) -> None:
-        # Make sure the query thread is stopped
-        if self.query_thread_running:
-            self.query_thread_running = False
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the query thread, if it is running."""
+
+        self.query_thread_running = False
 
     @property
     def version(self) -> int:
@@ -142,10 +191,22 @@ class QuoteTableState:
 
         self._query_thread_running = value
         if self._query_thread_running:
-            self._last_query_time = monotonic()
+            self._query_thread_stop = Event()
+            self._query_thread = Thread(
+                target=self._retrieve_quotes,
+                args=(self._query_thread_stop,),
+                name="quote-query",
+                daemon=True,
+            )
             self._query_thread.start()
-        else:
-            self._query_thread.join()
+        elif self._query_thread is not None:
+            self._query_thread_stop.set()
+            # Don't let a stalled query (with its retries) hold up the caller, which is
+            # usually the UI thread
+            self._query_thread.join(QuoteTableState._QUERY_THREAD_JOIN_TIMEOUT)
+            if self._query_thread.is_alive():
+                logging.warning("The query thread did not stop in time; leaving it")
+            self._query_thread = None
 
     @property
     def sort_column_key(self) -> str:
@@ -157,11 +218,11 @@ class QuoteTableState:
     def sort_column_key(self, value: str) -> None:
         if value == self._sort_column_key:
             return
-        self._sort_column_key = value
-        self._sort_key_func = ALL_QUOTE_COLUMNS[self._sort_column_key].sort_key_func
         with self._quotes_lock:
-            self._sort_quotes()
-        self._version += 1
+            self._sort_column_key = value
+            self._sort_key_func = ALL_QUOTE_COLUMNS[self._sort_column_key].sort_key_func
+            self._sort_quotes(self._quotes)
+            self._version += 1
 
     @property
     def sort_column_idx(self) -> int:
@@ -183,10 +244,15 @@ class QuoteTableState:
     def sort_direction(self, value: SortDirection) -> None:
         if value == self._sort_direction:
             return
-        self._sort_direction = value
         with self._quotes_lock:
-            self._sort_quotes()
-        self._version += 1
+            # The quotes are always sorted on the current column and direction (they
+            # are re-sorted under the lock whenever either changes), with the symbol as
+            # the tie breaker, so the sort keys are unique and flipping the direction
+            # is just a matter of reversing the order. The direction is changed under
+            # the lock too, lest a concurrent sort use it before the reversal.
+            self._sort_direction = value
+            self._replace_quotes(self._quotes[::-1])
+            self._version += 1
 
     @property
     def query_frequency(self) -> int:
@@ -197,6 +263,7 @@ class QuoteTableState:
     @query_frequency.setter
     def query_frequency(self, value: int) -> None:
         self._query_frequency = value
+        self._query_interval = value
         # Don't change the version. This is a setting for the backend, not the UI.
 
     @property
@@ -218,14 +285,15 @@ class QuoteTableState:
         if value == self._hovered_column or value < -1 or value >= len(self._columns):
             return
         self._hovered_column = value
-        self._version += 1
+        self._bump_version()
 
     @property
     def cursor_row(self) -> int:
         """The current row of the cursor."""
 
-        with self._quotes_lock:
-            return self.__get_cursor_row_no_lock()
+        # The index of the quotes is only ever replaced as a whole, so it can be read
+        # without the lock
+        return self._quotes_indices.get(self._cursor_symbol, -1)
 
     def __get_cursor_row_no_lock(self) -> int:
         """
@@ -246,14 +314,7 @@ class QuoteTableState:
 
         # Return the index of the quote (from _quotes) whose ticker symbol matches the
         # cursor symbol
-        return next(
-            (
-                i
-                for i, quote in enumerate(self._quotes)
-                if quote.symbol == self._cursor_symbol
-            ),
-            -1,
-        )
+        return self._quotes_indices.get(self._cursor_symbol, -1)
 
     @cursor_row.setter
     def cursor_row(self, value: int) -> None:
@@ -300,37 +361,59 @@ class QuoteTableState:
         The quotes to display in the quote table.
 
         Note:
-            Each quote is comprised of the elements required for each column.
+            Each quote is comprised of the elements required for each column. The
+            rows are only rebuilt when the quotes or the columns have changed, and
+            the same list is returned otherwise; it must not be modified.
 
         Returns:
             list[QuoteRow]: The quotes to display in the quote table.
         """
 
-        with self._quotes_lock:
-            quote_info: list[QuoteRow] = [
-                QuoteRow(
-                    q.symbol,
-                    # TODO Could it be possible to have this array be fixed and
-                    # saved whenever we change the columns?
+        # The quotes list is never modified in place, only replaced (under the lock),
+        # so the rows can be built from a snapshot of it, without taking the lock
+        quotes: list[YQuote] = self._quotes
+        formatters = self._columns_formatters
+
+        # Both are replaced whenever what they hold changes, so the rows built for
+        # them can be reused for as long as they are the current ones
+        cache = self._quotes_rows_cache
+        if cache is not None and cache[0] is quotes and cache[1] is formatters:
+            return cache[2]
+
+        quote_info: list[QuoteRow] = [
+            QuoteRow(
+                q.symbol,
+                tuple(
                     [
                         QuoteCell(
-                            ALL_QUOTE_COLUMNS[column.key].format_func(q),
-                            ALL_QUOTE_COLUMNS[column.key].sign_indicator_func(q),
-                            ALL_QUOTE_COLUMNS[column.key].justification,
+                            format_func(q),
+                            0 if sign_func is None else sign_func(q),
+                            justification,
                         )
-                        for column in self._columns
-                    ],
-                )
-                for q in self._quotes
-            ]
+                        for format_func, sign_func, justification in formatters
+                    ]
+                ),
+            )
+            for q in quotes
+        ]
 
-            return quote_info
+        self._quotes_rows_cache = (quotes, formatters, quote_info)
+        return quote_info
 
     @property
     def column_keys(self) -> list[str]:
-        """The keys of the columns of the quote table."""
+        """
+        The keys of the columns of the quote table.
+
+        Note:
+            The keys are only rebuilt when the columns change, and the same list is
+            returned otherwise; it must not be modified.
 
-        return [c.key for c in self._columns]
+        Returns:
+            list[str]: The keys of the columns of the quote table.
+        """
+
+        return self._column_keys
 
     def append_column(self, column_key: str) -> None:
         """
@@ -351,7 +434,8 @@ class QuoteTableState:
             return
 
         self._columns.append(ALL_QUOTE_COLUMNS[column_key])
-        self._version += 1
+        self._refresh_columns_cache()
+        self._bump_version()
 
     def insert_column(self, index: int, column_key: str) -> None:
         """
@@ -378,7 +462,8 @@ class QuoteTableState:
             return
 
         self._columns.insert(index, ALL_QUOTE_COLUMNS[column_key])
-        self._version += 1
+        self._refresh_columns_cache()
+        self._bump_version()
 
     def remove_column(self, column_key: str) -> None:
         """
@@ -396,30 +481,68 @@ class QuoteTableState:
             ValueError: If the column key does not exist in the table.
         """
 
-        try:
-            if column_key == QuoteTableState._TICKER_COLUMN_KEY:
-                error_msg = "Cannot remove ticker column"
-                raise ValueError(error_msg)
-            self._columns.remove(ALL_QUOTE_COLUMNS[column_key])
-            if self._sort_column_key == column_key:
+        if column_key == QuoteTableState._TICKER_COLUMN_KEY:
+            error_msg = "Cannot remove ticker column"
+            raise ValueError(error_msg)
+        if column_key not in self._column_keys_set:
+            error_msg = f"Column key {column_key} does not exist in the quote table"
+            raise ValueError(error_msg)
+
+        del self._columns[self._column_keys.index(column_key)]
+        self._refresh_columns_cache()
+        if self._sort_column_key == column_key:
+            with self._quotes_lock:
                 self._sort_column_key = QuoteTableState._TICKER_COLUMN_KEY
+                self._sort_key_func = ALL_QUOTE_COLUMNS[
+                    self._sort_column_key
+                ].sort_key_func
+                self._sort_quotes(self._quotes)
 
-            self._version += 1
-        except KeyError as exc:
-            error_msg = f"Column key {column_key} does not exist in the quote table"
-            raise ValueError(error_msg) from exc
+        self._bump_version()
 
-    def _can_add_column(self, column_key: str) -> bool:
+    def _refresh_columns_cache(self) -> None:
+        """
+        Refresh the data derived from the columns of the quote table.
+
+        Note:
+            Must be called whenever the columns are modified.
+        """
+
+        # The sign indicator function is dropped for the columns that are always
+        # neutral, to save a call per cell
+        self._columns_formatters = tuple(
+            (
+                c.format_func,
+                (
+                    None
+                    if c.sign_indicator_func is neutral_sign
+                    else c.sign_indicator_func
+                ),
+                c.justification,
+            )
+            for c in self._columns
+        )
+        self._column_keys = [c.key for c in self._columns]
+        self._column_keys_set = set(self._column_keys)
+
+    def _can_add_column(
+        self, column_key: str, column_keys: set[str] | None = None
+    ) -> bool:
         """
         Check if the column can be added to the quote table.
 
         Args:
             column_key (str): The identifier of the column to add.
+            column_keys (set[str], optional): The keys of the columns to check for
+                duplicates against. Defaults to the keys of the table's columns.
 
         Returns:
             bool: Whether the column can be added to the quote table.
         """
 
+        if column_keys is None:
+            column_keys = self._column_keys_set
+
         if column_key not in ALL_QUOTE_COLUMNS:
             logging.warning(
                 "Invalid column key '%s' specified in config file",
@@ -427,7 +550,7 @@ class QuoteTableState:
             )
             return False
 
-        if column_key in self.column_keys:
+        if column_key in column_keys:
             logging.warning(
                 "Duplicate column key '%s' specified in config file",
                 column_key,
@@ -466,23 +589,29 @@ class QuoteTableState:
             # list of quotes
             symbol = self._quotes[index].symbol
             self._quotes_symbols.remove(symbol)
-            self._quotes.pop(index)
+            self._replace_quotes(self._quotes[:index] + self._quotes[index + 1 :])
             self._version += 1
 
-    def _retrieve_quotes(self) -> None:
-        """Query for the quotes and update the change version."""
+    def _retrieve_quotes(self, stop: Event) -> None:
+        """
+        Query for the quotes and update the change version, until asked to stop.
 
-        now: float = monotonic()
-        while self._query_thread_running:
-            self._retrieve_quotes_internal(now)
+        Args:
+            stop (Event): The event set to stop the queries.
+        """
 
-            while now - self._last_query_time < self._query_frequency:
-                if not self._query_thread_running:
-                    return
-                sleep(1)
-                now = monotonic()
+        while not stop.is_set():
+            self._retrieve_quotes_internal(monotonic(), stop)
+            # Wait until the next query is due, unless asked to stop in the meantime.
+            # It is due a query interval after the start of the last one, so that the
+            # time spent querying doesn't push all the later queries back.
+            stop.wait(
+                max(0.0, self._last_query_time + self._query_interval - monotonic())
+            )
 
-    def _retrieve_quotes_internal(self, monotonic_clock: float) -> None:
+    def _retrieve_quotes_internal(
+        self, monotonic_clock: float, stop: Event | None = None
+    ) -> None:
         """
         Query for the quotes from the YFinance interface and update the change version.
 
@@ -491,34 +620,110 @@ class QuoteTableState:
 
         Args:
             monotonic_clock (float): A monotonic clock time.
+            stop (Event | None): The event set to stop the queries, if any. When it is
+                set during the query, the quotes are dropped.
         """
 
         with self._quotes_lock:
-            self._quotes = self._yfin.retrieve_quotes(self._quotes_symbols)
-            self._sort_quotes()
+            symbols: list[str] = self._quotes_symbols[:]
+
+        # Don't hold the lock while waiting for the quotes, as it would block the
+        # writers on the UI thread (sorting, row removal) for the whole query
+        quotes: list[YQuote] = self._yfin.retrieve_quotes(symbols)
+        if stop is not None and stop.is_set():
+            # Stopped while querying; a thread left behind by the stop, or by a restart,
+            # must not publish over the state of the current one
+            return
+        self._update_query_interval(quotes)
+
+        with self._quotes_lock:
+            # Drop the quotes of the symbols removed during the query, if any
+            if len(self._quotes_symbols) < len(symbols):
+                removed_symbols: set[str] = set(symbols).difference(
+                    self._quotes_symbols
+                )
+                quotes = [q for q in quotes if q.symbol not in removed_symbols]
+            self._sort_quotes(quotes)
+            self._version += 1
         self._last_query_time = monotonic_clock
-        self._version += 1
 
-    def _sort_quotes(self) -> None:
+    def _bump_version(self) -> None:
         """
-        Sort the quotes, according to the sort column and direction.
+        Bump the version of the quote data.
 
-        Raises:
-            QuoteTableState.QuoteLockError: If the _quotes_lock is not acquired.
+        The version is bumped by both the UI and the query threads, so the increment
+        is done under the _quotes_lock, lest one of the bumps be lost.
         """
 
-        if not self._quotes_lock.locked():
-            raise QuoteTableState.QuoteLockError(__name__)
+        with self._quotes_lock:
+            self._version += 1
+
+    def _update_query_interval(self, quotes: list[YQuote]) -> None:
+        """
+        Update the time to wait before the next query, based on the latest quotes.
+
+        The interval grows while the quotes don't change (e.g. when the markets are
+        closed), up to _MAX_QUERY_BACKOFF times the query frequency, and goes back
+        to the query frequency as soon as they do.
+
+        Args:
+            quotes (list[YQuote]): The latest quotes.
+        """
 
-        self._quotes.sort(
-            key=self._sort_key_func,
-            reverse=(self._sort_direction == SortDirection.DESCENDING),
+        signature: int = hash(
+            tuple(
+                (q.symbol, q.regular_market_price, q.regular_market_volume)
+                for q in quotes
+            )
         )
+        if signature == self._last_quotes_signature:
+            self._query_interval = min(
+                self._query_interval * QuoteTableState._QUERY_BACKOFF_FACTOR,
+                self._query_frequency * QuoteTableState._MAX_QUERY_BACKOFF,
+            )
+        else:
+            self._query_interval = self._query_frequency
+        self._last_quotes_signature = signature
+
+    def _sort_quotes(self, quotes: list[YQuote]) -> None:
+        """
+        Sort quotes according to the sort column and direction, and make them current.
+
+        This method expects the _quotes_lock to have been acquired beforehand.
+
+        Args:
+            quotes (list[YQuote]): The quotes to sort.
+        """
+
+        # Replace the list rather than sorting it in place, as it may be in use by a
+        # reader (see quotes_rows)
+        self._replace_quotes(
+            sorted(
+                quotes,
+                key=self._sort_key_func,
+                reverse=(self._sort_direction == SortDirection.DESCENDING),
+            )
+        )
+
+    def _replace_quotes(self, quotes: list[YQuote]) -> None:
+        """
+        Replace the quotes, and the index of their symbols.
+
+        This method expects the _quotes_lock to have been acquired beforehand. The
+        quotes and their index are replaced rather than modified, so that readers
+        can use them without taking the lock.
+
+        Args:
+            quotes (list[YQuote]): The new quotes.
+        """
+
+        self._quotes = quotes
+        self._quotes_indices = {quote.symbol: i for i, quote in enumerate(quotes)}
 
     ##############################################################################
     # Configuration load and save
     ##############################################################################
-    def load_config(self, config: dict[str, Any]) -> None:  # noqa: PLR0912 FIXME?
+    def load_config(self, config: dict[str, Any]) -> None:
         """
         Load the configuration for the quote table.
 
@@ -526,75 +731,134 @@ class QuoteTableState:
             config (dict[str, Any]): The configuration dictionary to load.
         """
 
-        columns_keys: list[str] = (
-            config[QuoteTableState._COLUMNS][:]
-            if QuoteTableState._COLUMNS in config
-            else []
-        )
+        # The lists from the config are only read, never modified, so they don't need
+        # to be copied
+        columns_keys: list[str] = config.get(QuoteTableState._COLUMNS, [])
         sort_key: str | None = config.get(QuoteTableState._SORT_COLUMN, None)
         sort_direction: str | None = config.get(QuoteTableState._SORT_DIRECTION, None)
-        quotes_symbols: list[str] = (
-            config[QuoteTableState._QUOTES][:]
-            if QuoteTableState._QUOTES in config
-            else []
-        )
+        quotes_symbols: list[str] = config.get(QuoteTableState._QUOTES, [])
         query_frequency: int | None = config.get(QuoteTableState._QUERY_FREQUENCY, None)
 
-        # TODO: Check if values are actually changed, and if so, bump the version
+        # Each setting is only applied if it changed, so that reloading the current
+        # configuration leaves the table, and its quote rows, untouched
+        changed: bool = False
 
-        # Validate the column keys
-        if len(columns_keys) == 0:
-            logging.warning("No columns specified in config file")
-            columns_keys = [
-                QuoteTableState._TICKER_COLUMN_KEY
-            ] + QuoteTableState._DEFAULT_COLUMN_KEYS[:]
-        else:
-            # Ticker is *always* the first column
-            columns_keys.insert(0, QuoteTableState._TICKER_COLUMN_KEY)
-
-        self._columns.clear()
-        # Make sure the column keys are supported and there are no duplicates
-        for column_key in columns_keys:
-            self.append_column(column_key)
+        # The columns are all set at once, rather than appended one by one, to only
+        # refresh the columns cache once
+        valid_columns_keys: list[str] = self._validate_columns_keys(columns_keys)
+        if valid_columns_keys != self._column_keys:
+            self._columns[:] = [ALL_QUOTE_COLUMNS[key] for key in valid_columns_keys]
+            self._refresh_columns_cache()
+            changed = True
 
         # Validate the sort column key
-        if sort_key is None or sort_key not in self.column_keys:
-            self._sort_column_key = self._columns[0].key
-        else:
-            self._sort_column_key = sort_key
+        if sort_key is None or sort_key not in self._column_keys_set:
+            sort_key = self._columns[0].key
 
         # Validate the sort direction
         try:
-            self._sort_direction = get_enum_member(SortDirection, sort_direction)
+            new_sort_direction: SortDirection = get_enum_member(
+                SortDirection, sort_direction
+            )
         except ValueError:
-            self._sort_direction = QuoteTableState._DEFAULT_SORT_DIRECTION
+            new_sort_direction = QuoteTableState._DEFAULT_SORT_DIRECTION
+
+        sort_changed: bool = (sort_key, new_sort_direction) != (
+            self._sort_column_key,
+            self._sort_direction,
+        )
+        if sort_changed:
+            self._sort_column_key = sort_key
+            self._sort_direction = new_sort_direction
+            changed = True
 
         # Validate the quotes symbols
-        if len(quotes_symbols) == 0:
-            logging.warning("No quotes specified in config file")
-            self._quotes_symbols = QuoteTableState._DEFAULT_QUOTES[:]
-        else:
-            self._quotes_symbols.clear()
-            for quote_symbol in quotes_symbols:
-                if quote_symbol == "":  # noqa: PLC1901
-                    logging.warning("Empty quote symbol specified in config file")
-                elif quote_symbol in self._quotes_symbols:
-                    logging.warning(
-                        "Duplicate quote symbol %s specified in config file",
-                        quote_symbol,
-                    )
-                else:
-                    self._quotes_symbols.append(quote_symbol.upper())
+        symbols: list[str] = QuoteTableState._validate_quotes_symbols(quotes_symbols)
+        if symbols != self._quotes_symbols:
+            self._quotes_symbols = symbols
+            changed = True
 
         # Validate the query frequency
         if query_frequency is None or query_frequency <= 1:
             logging.warning("Invalid query frequency specified in config file")
-            self._query_frequency = QuoteTableState._DEFAULT_QUERY_FREQUENCY
-        else:
+            query_frequency = QuoteTableState._DEFAULT_QUERY_FREQUENCY
+        if query_frequency != self._query_frequency:
             self._query_frequency = query_frequency
+            self._query_interval = self._query_frequency
 
         # Set other properties based on the configuration
-        self._sort_key_func = ALL_QUOTE_COLUMNS[self._sort_column_key].sort_key_func
+        if sort_changed:
+            self._sort_key_func = ALL_QUOTE_COLUMNS[self._sort_column_key].sort_key_func
+            with self._quotes_lock:
+                self._sort_quotes(self._quotes)
+        if changed:
+            self._bump_version()
+
+    def _validate_columns_keys(self, columns_keys: list[str]) -> list[str]:
+        """
+        Validate the column keys of a configuration.
+
+        Args:
+            columns_keys (list[str]): The column keys from the configuration.
+
+        Returns:
+            list[str]: The supported column keys, without duplicates, and with the
+                ticker column first.
+        """
+
+        if len(columns_keys) == 0:
+            logging.warning("No columns specified in config file")
+            columns_keys = [
+                QuoteTableState._TICKER_COLUMN_KEY,
+                *QuoteTableState._DEFAULT_COLUMN_KEYS,
+            ]
+        else:
+            # Ticker is *always* the first column
+            columns_keys = [QuoteTableState._TICKER_COLUMN_KEY, *columns_keys]
+
+        # Make sure the column keys are supported and there are no duplicates
+        valid_columns_keys: list[str] = []
+        valid_columns_keys_set: set[str] = set()
+        for column_key in columns_keys:
+            if self._can_add_column(column_key, valid_columns_keys_set):
+                valid_columns_keys.append(column_key)
+                valid_columns_keys_set.add(column_key)
+
+        return valid_columns_keys
+
+    @staticmethod
+    def _validate_quotes_symbols(quotes_symbols: list[str]) -> list[str]:
+        """
+        Validate the quotes symbols of a configuration.
+
+        Args:
+            quotes_symbols (list[str]): The quotes symbols from the configuration.
+
+        Returns:
+            list[str]: The non-empty symbols, in upper case and without duplicates.
+        """
+
+        if len(quotes_symbols) == 0:
+            logging.warning("No quotes specified in config file")
+            return list(QuoteTableState._DEFAULT_QUOTES)
+
+        symbols: list[str] = []
+        # The symbols are compared in upper case, as they are stored
+        seen_symbols: set[str] = set()
+        for quote_symbol in quotes_symbols:
+            symbol: str = quote_symbol.upper()
+            if symbol == "":  # noqa: PLC1901
+                logging.warning("Empty quote symbol specified in config file")
+            elif symbol in seen_symbols:
+                logging.warning(
+                    "Duplicate quote symbol %s specified in config file",
+                    quote_symbol,
+                )
+            else:
+                seen_symbols.add(symbol)
+                symbols.append(symbol)
+
+        return symbols
 
     def save_config(self) -> dict[str, Any]:
         """
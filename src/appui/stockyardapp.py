@@ -111,11 +111,16 @@ class StockyardApp(App[None]):
     def save_config(self, path: str) -> None:
         """Save the configuration for the app."""
 
+        config: dict[str, Any] = self._state.save_config()
+        config_path: Path = Path(path)
+        # Write the config to a temporary file and swap it in once complete, so that a
+        # failed write can't leave a truncated config file behind
+        temp_path: Path = config_path.with_name(config_path.name + ".tmp")
         try:
             f: TextIOWrapper
-            with Path(path).open("w", encoding="utf-8") as f:
-                config: dict[str, Any] = self._state.save_config()
+            with temp_path.open("w", encoding="utf-8") as f:
                 json.dump(config, f, indent=4)
+            temp_path.replace(config_path)
         except FileNotFoundError:
             logging.exception("save_config: Config file not found: %s", path)
         except PermissionError:
@@ -106,11 +106,9 @@ class StockyardAppState:
 
         quote_table_config: dict[str, Any] = config.get(self._QUOTE_TABLE, {})
         time_format: str | None = config.get(StockyardAppState._TIME_FORMAT, None)
-        log_level: str | None = (
-            config[StockyardAppState._LOG_LEVEL].upper()
-            if StockyardAppState._LOG_LEVEL in config
-            else None
-        )
+        log_level: str | None = config.get(StockyardAppState._LOG_LEVEL)
+        if log_level is not None:
+            log_level = log_level.upper()
 
         self._quote_table_state.load_config(quote_table_config)
 
@@ -12,11 +12,14 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import TYPE_CHECKING, Any, Final
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.cookies import RequestsCookieJar
+from urllib3.util import Retry
 
 if TYPE_CHECKING:
     from http.cookiejar import Cookie
@@ -26,6 +29,9 @@ class YClient:
     """Yahoo! Finance API client."""
 
     _DEFAULT_HTTP_TIMEOUT: Final[int] = 80
+    _HTTP_RETRIES: Final[int] = 3
+    _HTTP_RETRY_BACKOFF_FACTOR: Final[float] = 0.3
+    _HTTP_RETRY_STATUSES: Final[tuple[int, ...]] = (429, 500, 502, 503, 504)
     _YAHOO_FINANCE_URL: Final[str] = "https://finance.yahoo.com"
     _YAHOO_FINANCE_QUERY_URL: Final[str] = "https://query1.finance.yahoo.com"
     _CRUMB_URL: Final[str] = _YAHOO_FINANCE_QUERY_URL + "/v1/test/getcrumb"
@@ -54,6 +60,20 @@ class YClient:
 
     def __init__(self) -> None:
         self._session: requests.Session = requests.Session()
+        # Retry transient failures on the session's pooled (kept alive) connections.
+        # The last response is returned rather than raised on, so that it goes
+        # through the regular status checks.
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=self._HTTP_RETRIES,
+                    backoff_factor=self._HTTP_RETRY_BACKOFF_FACTOR,
+                    status_forcelist=self._HTTP_RETRY_STATUSES,
+                    raise_on_status=False,
+                )
+            ),
+        )
         self._session.headers.update(
             {
                 "authority": "query1.finance.yahoo.com",
@@ -79,6 +99,9 @@ class YClient:
             1970, 1, 1, tzinfo=datetime.now().astimezone().tzinfo
         )
         self._crumb: str = ""
+        # The client can be called from several threads at once, which must not all
+        # refresh the cookies and crumb
+        self._auth_lock: Lock = Lock()
 
     def __refresh_cookies(self) -> None:
         """
@@ -326,17 +349,20 @@ class YClient:
 
         logging.debug("Calling %s with params %s", api_url, query_params)
 
-        if self._expiry < datetime.now(timezone.utc).astimezone():
-            self.__refresh_cookies()
+        with self._auth_lock:
+            if self._expiry < datetime.now(timezone.utc).astimezone():
+                self.__refresh_cookies()
 
-        if not self._crumb:
-            self.__refresh_crumb()
+            if not self._crumb:
+                self.__refresh_crumb()
+
+            crumb: str = self._crumb
 
         if query_params is None:
             query_params = {}
 
-        if self._crumb:
-            query_params["crumb"] = self._crumb
+        if crumb:
+            query_params["crumb"] = crumb
 
         if len(query_params) > 0:
             query_string = urlencode(query_params)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Final
 
 from ._yclient import YClient
@@ -13,6 +14,8 @@ class YFinance:
     """A Python interface to the Yahoo! Finance API."""
 
     _QUOTE_API: Final[str] = "/v7/finance/quote"
+    _MAX_SYMBOLS_PER_QUERY: Final[int] = 50
+    _MAX_CONCURRENT_QUERIES: Final[int] = 4
 
     def __init__(self) -> None:
         """Initialize the Yahoo! Finance API interface."""
@@ -28,6 +31,10 @@ class YFinance:
         """
         Retrieve quotes for the given symbols.
 
+        The symbols are queried in batches of at most _MAX_SYMBOLS_PER_QUERY symbols,
+        to keep the size of the request URLs bounded. When there are several batches,
+        up to _MAX_CONCURRENT_QUERIES of them are queried at once.
+
         Args:
             symbols (list[str]): The symbols to get quotes for.
 
@@ -39,6 +46,35 @@ class YFinance:
             logging.error("No symbols provided")
             return []
 
+        batch_size: int = YFinance._MAX_SYMBOLS_PER_QUERY
+        batches: list[list[str]] = [
+            symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)
+        ]
+        if len(batches) == 1:
+            return self._retrieve_quotes_batch(batches[0])
+
+        # The results of map come in the order of the batches, whatever the order in
+        # which the queries complete
+        with ThreadPoolExecutor(
+            max_workers=min(len(batches), YFinance._MAX_CONCURRENT_QUERIES)
+        ) as executor:
+            return [
+                quote
+                for batch_quotes in executor.map(self._retrieve_quotes_batch, batches)
+                for quote in batch_quotes
+            ]
+
+    def _retrieve_quotes_batch(self, symbols: list[str]) -> list[YQuote]:
+        """
+        Retrieve quotes for the given symbols, in a single query.
+
+        Args:
+            symbols (list[str]): The symbols to get quotes for.
+
+        Returns:
+            list[YQuote]: The quotes for the given symbols.
+        """
+
         # call YClient.call with symbols stripped of whitespace
         json_data: dict[str, Any] = self._yclient.call(
             self._QUOTE_API, {"symbols": ",".join([s.strip() for s in symbols])}
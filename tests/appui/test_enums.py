@@ -51,3 +51,11 @@ def test_get_enum_member_invalid() -> None:
         ValueError, match=r"Value '1h' is not a valid member of TimeFormat"
     ):
         get_enum_member(TimeFormat, "1h")
+
+
+@pytest.mark.parametrize("value", [None, ["12h"], 12])
+def test_get_enum_member_invalid_type(value: Any) -> None:  # noqa: ANN401
+    """Verify ValueError is raised when converting values of the wrong type."""
+
+    with pytest.raises(ValueError, match=r"is not a valid member of TimeFormat"):
+        get_enum_member(TimeFormat, value)
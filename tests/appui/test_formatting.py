@@ -49,6 +49,15 @@ def test_as_float(
         assert fmt.as_float(input_value, precision) == expected_output
 
 
+def test_signed_zeros() -> None:
+    """Verify 0.0 and -0.0 keep their sign, whichever is formatted first."""
+
+    assert fmt.as_float(0.0) == "0.00"
+    assert fmt.as_float(-0.0) == "-0.00"
+    assert fmt.as_percent(-0.0) == "-0.00%"
+    assert fmt.as_percent(0.0) == "0.00%"
+
+
 @pytest.mark.parametrize(
     ("input_value", "expected_output"),
     [
@@ -56,10 +65,17 @@ def test_as_float(
         (1, "1"),
         (10, "10"),
         (200, "200"),
+        (999, "999"),
+        (1000, "1.00K"),
+        (1023, "1.02K"),
+        (1024, "1.02K"),
         (1234, "1.23K"),
+        (999999, "1000.00K"),
         (1000000, "1.00M"),
+        (1048576, "1.05M"),
         (1000000000, "1.00B"),
         (1000000000000, "1.00T"),
+        (1234000000000000, "1234.00T"),
     ],
 )
 def test_as_compact_int(input_value: int, expected_output: str) -> None:
@@ -0,0 +1,169 @@
+"""Validate the rendering of the quote table's header."""
+
+# pylint: disable=protected-access
+
+# pyright: reportPrivateUsage=none
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Final
+
+from textual.app import App
+
+from appui._enums import SortDirection
+from appui._quote_table import QuoteTable
+from appui.quote_table_state import QuoteTableState
+from tests.fake_yfinance import FakeYFinance
+
+if TYPE_CHECKING:
+    from textual.app import ComposeResult
+    from textual.strip import Strip
+
+# Time for the table to pick up the changes of the state (it polls every 0.1 s)
+UPDATE_DELAY: Final[float] = 0.3
+
+
+class QuoteTableApp(App[None]):
+    """An app holding nothing but a quote table."""
+
+    def __init__(self, state: QuoteTableState) -> None:
+        """
+        Initialize the app.
+
+        Args:
+            state: The state of the quote table.
+        """
+
+        super().__init__()
+        self._state: QuoteTableState = state
+
+    def compose(self) -> ComposeResult:
+        """
+        Compose the app.
+
+        Yields:
+            The quote table.
+        """
+
+        yield QuoteTable(self._state)
+
+
+def make_state(config: dict[str, Any]) -> QuoteTableState:
+    """
+    Provide a QuoteTableState loaded with the given config.
+
+    Args:
+        config: The config to load.
+
+    Returns:
+        QuoteTableState: The state, fetching its quotes from a FakeYFinance.
+    """
+
+    state = QuoteTableState(FakeYFinance())
+    state.load_config({QuoteTableState._QUERY_FREQUENCY: 60, **config})
+    return state
+
+
+def header(table: QuoteTable) -> Strip:
+    """
+    Render the header of the table.
+
+    Args:
+        table: The table.
+
+    Returns:
+        Strip: The rendered header line.
+    """
+
+    return table.render_line(0)
+
+
+def highlighted_column(table: QuoteTable, column_count: int) -> int:
+    """
+    Find the highlighted column in the header of the table.
+
+    Args:
+        table: The table.
+        column_count: The number of columns of the table.
+
+    Returns:
+        int: The index of the only column with a background color different from the
+            others, or -1.
+    """
+
+    # The styles themselves all differ, as they hold the coordinates of their cell
+    colors = [
+        None if segment.style is None else segment.style.bgcolor
+        for segment in header(table)
+    ][:column_count]
+    unique = [i for i, color in enumerate(colors) if colors.count(color) == 1]
+    return unique[0] if len(unique) == 1 else -1
+
+
+def test_sort_change_repaints_header() -> None:
+    """Ensure the sort arrow follows the sort, even when the rows don't change."""
+
+    state: QuoteTableState = make_state(
+        {
+            QuoteTableState._QUOTES: ["AAPL"],
+            QuoteTableState._COLUMNS: ["last", "change_percent"],
+        }
+    )
+
+    async def run() -> None:
+        app = QuoteTableApp(state)
+        async with app.run_test() as pilot:
+            await pilot.pause(UPDATE_DELAY)
+            table: QuoteTable = app.query_one(QuoteTable)
+            assert "Ticker ▼" in header(table).text
+
+            state.sort_direction = SortDirection.DESCENDING
+            await pilot.pause(UPDATE_DELAY)
+            assert "Ticker ▲" in header(table).text
+
+            state.sort_column_key = "last"
+            await pilot.pause(UPDATE_DELAY)
+            assert "▲ Last" in header(table).text
+            assert "Ticker ▲" not in header(table).text
+
+    asyncio.run(run())
+
+
+def test_ordering_highlight_moves() -> None:
+    """Ensure the highlighted column follows the moves in ordering mode."""
+
+    columns: list[str] = ["last", "change_percent", "volume"]
+    state: QuoteTableState = make_state(
+        {
+            QuoteTableState._QUOTES: ["AAPL", "F", "VT"],
+            QuoteTableState._COLUMNS: columns,
+        }
+    )
+    column_count: int = len(columns) + 1  # +1 for the ticker column
+
+    async def run() -> None:
+        app = QuoteTableApp(state)
+        async with app.run_test() as pilot:
+            await pilot.pause(UPDATE_DELAY)
+            table: QuoteTable = app.query_one(QuoteTable)
+            table.focus()
+
+            # Ordering starts on the sort column, i.e. the ticker
+            await pilot.press("o")
+            await pilot.pause(UPDATE_DELAY)
+            assert highlighted_column(table, column_count) == 0
+
+            await pilot.press("right")
+            await pilot.pause(UPDATE_DELAY)
+            assert highlighted_column(table, column_count) == 1
+
+            await pilot.press("right")
+            await pilot.pause(UPDATE_DELAY)
+            assert highlighted_column(table, column_count) == 2  # noqa: PLR2004
+
+            await pilot.press("left")
+            await pilot.pause(UPDATE_DELAY)
+            assert highlighted_column(table, column_count) == 1
+
+    asyncio.run(run())
@@ -9,7 +9,8 @@ from __future__ import annotations
 import math
 import re
 from contextlib import contextmanager
-from time import sleep
+from threading import Event
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any, Final
 
 import pytest
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from appui._quote_table_data import QuoteRow
+    from yfinance import YQuote
 
 # A number with 2 decimal values
 NUMBER_RE: Final[re.Pattern[str]] = re.compile(r"^(?:-?\d+\.\d{2}|N/A)$", re.MULTILINE)
@@ -123,7 +125,7 @@ def test_load_empty_config(quote_table_state: QuoteTableState) -> None:
     ]
     assert quote_table_state.sort_column_key == QuoteTableState._TICKER_COLUMN_KEY
     assert quote_table_state.sort_direction == QuoteTableState._DEFAULT_SORT_DIRECTION
-    assert quote_table_state._quotes_symbols == QuoteTableState._DEFAULT_QUOTES
+    assert quote_table_state._quotes_symbols == list(QuoteTableState._DEFAULT_QUOTES)
     assert quote_table_state.query_frequency == QuoteTableState._DEFAULT_QUERY_FREQUENCY
 
 
@@ -169,6 +171,29 @@ def test_load_config_duplicate_default_column(
     ]
 
 
+def test_load_config_bumps_version_once(quote_table_state: QuoteTableState) -> None:
+    """Ensure loading a config changes the version only once, whatever its size."""
+
+    config: dict[str, Any] = {
+        QuoteTableState._COLUMNS: ["last", "change", "change_percent", "volume"],
+    }
+    orig_version: int = quote_table_state.version
+    quote_table_state.load_config(config)
+    assert quote_table_state.version == orig_version + 1
+
+
+def test_load_unchanged_config(quote_table_state: QuoteTableState) -> None:
+    """Ensure reloading the current config leaves the state untouched."""
+
+    quote_table_state._retrieve_quotes_internal(0)
+    rows: list[QuoteRow] = quote_table_state.quotes_rows
+    orig_version: int = quote_table_state.version
+
+    quote_table_state.load_config(quote_table_state.save_config())
+    assert quote_table_state.version == orig_version
+    assert quote_table_state.quotes_rows is rows
+
+
 def test_load_config_invalid_sort_column(quote_table_state: QuoteTableState) -> None:
     """Ensure default column is used when invalid one is provided in config."""
 
@@ -222,6 +247,18 @@ def test_load_config_duplicate_quote_symbol(quote_table_state: QuoteTableState)
     assert quote_table_state._quotes_symbols == ["AAPL", "F", "VT"]
 
 
+def test_load_config_duplicate_quote_symbol_case(
+    quote_table_state: QuoteTableState,
+) -> None:
+    """Ensure symbols differing only by their case are considered duplicates."""
+
+    config: dict[str, Any] = {
+        QuoteTableState._QUOTES: ["AAPL", "f", "F", "vt", "aapl"],
+    }
+    quote_table_state.load_config(config)
+    assert quote_table_state._quotes_symbols == ["AAPL", "F", "VT"]
+
+
 ##############################################################################
 # save_config tests
 ##############################################################################
@@ -322,6 +359,26 @@ def test_default_get_quotes_rows(quote_table_state: QuoteTableState) -> None:
         assert COMPACT_RE.match(row.values[3].value)  # market_cap
 
 
+def test_quotes_rows_reused_until_changed(quote_table_state: QuoteTableState) -> None:
+    """Ensure the rows are only rebuilt when the quotes or the columns change."""
+
+    quote_table_state._retrieve_quotes_internal(0)
+    rows: list[QuoteRow] = quote_table_state.quotes_rows
+    assert quote_table_state.quotes_rows is rows
+
+    # Hovering a column bumps the version, but doesn't change the rows
+    quote_table_state.hovered_column = 1
+    assert quote_table_state.quotes_rows is rows
+
+    quote_table_state.sort_direction = SortDirection.DESCENDING
+    sorted_rows: list[QuoteRow] = quote_table_state.quotes_rows
+    assert sorted_rows is not rows
+    assert [row.key for row in sorted_rows] == [row.key for row in rows][::-1]
+
+    quote_table_state.append_column("open")
+    assert len(quote_table_state.quotes_rows[0].values) == len(rows[0].values) + 1
+
+
 ##############################################################################
 # quotes_rows (sorting) tests
 ##############################################################################
@@ -743,6 +800,124 @@ def test_delete_on_cursor_row_only(quote_table_state: QuoteTableState) -> None:
     assert len(quote_table_state._quotes_symbols) == 0
 
 
+def test_delete_row_during_query(quote_table_state: QuoteTableState) -> None:
+    """Ensure a row deleted while the quotes are being queried stays deleted."""
+
+    quote_table_state._retrieve_quotes_internal(0)
+    symbol_to_remove: str = quote_table_state.quotes_rows[0].key
+
+    class RemovingYFinance(FakeYFinance):
+        """Fake YFinance client that removes the first row while querying."""
+
+        def retrieve_quotes(self, symbols: list[str]) -> list[YQuote]:
+            quotes: list[YQuote] = super().retrieve_quotes(symbols)
+            quote_table_state.remove_row(0)
+            return quotes
+
+    quote_table_state._yfin = RemovingYFinance()
+    quote_table_state._retrieve_quotes_internal(0)
+
+    assert symbol_to_remove not in quote_table_state._quotes_symbols
+    assert symbol_to_remove not in [row.key for row in quote_table_state.quotes_rows]
+
+
+##############################################################################
+# Query tests
+##############################################################################
+
+
+def test_query_interval_backs_off_on_unchanged_quotes(
+    quote_table_state: QuoteTableState,
+) -> None:
+    """Ensure the queries slow down, within bounds, while the quotes don't change."""
+
+    query_frequency: int = quote_table_state.query_frequency
+
+    quote_table_state._retrieve_quotes_internal(0)
+    assert quote_table_state._query_interval == query_frequency
+
+    quote_table_state._retrieve_quotes_internal(0)
+    assert quote_table_state._query_interval == (
+        query_frequency * QuoteTableState._QUERY_BACKOFF_FACTOR
+    )
+
+    for _ in range(20):
+        quote_table_state._retrieve_quotes_internal(0)
+    assert quote_table_state._query_interval == (
+        query_frequency * QuoteTableState._MAX_QUERY_BACKOFF
+    )
+
+    # Changing the quotes brings the interval back to the query frequency
+    quote_table_state.remove_row(0)
+    quote_table_state._retrieve_quotes_internal(0)
+    assert quote_table_state._query_interval == query_frequency
+
+
+def test_query_thread_restarts(quote_table_state: QuoteTableState) -> None:
+    """Ensure the query thread can be stopped and started again."""
+
+    with thread_running_context(quote_table_state):
+        assert quote_table_state._query_thread is not None
+        assert quote_table_state._query_thread.is_alive()
+    assert quote_table_state._query_thread is None
+
+    with thread_running_context(quote_table_state):
+        assert quote_table_state._query_thread is not None
+        assert quote_table_state._query_thread.is_alive()
+    assert quote_table_state._query_thread is None
+
+
+def test_stopping_does_not_wait_on_stalled_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure stopping the queries doesn't wait for a query stuck on the network."""
+
+    release: Event = Event()
+
+    class StalledYFinance(FakeYFinance):
+        """Fake YFinance client whose queries stall until released."""
+
+        def retrieve_quotes(self, symbols: list[str]) -> list[YQuote]:
+            release.wait()
+            return super().retrieve_quotes(symbols)
+
+    monkeypatch.setattr(QuoteTableState, "_QUERY_THREAD_JOIN_TIMEOUT", 0.1)
+    quote_table_state = QuoteTableState(StalledYFinance())
+    quote_table_state.load_config({QuoteTableState._QUOTES: ["AAPL", "F", "VT"]})
+    quote_table_state.query_thread_running = True
+    query_thread = quote_table_state._query_thread
+    assert query_thread is not None
+
+    start: float = monotonic()
+    quote_table_state.close()
+    assert monotonic() - start < 1
+    assert query_thread.is_alive()
+
+    version: int = quote_table_state.version
+    last_query_time: float = quote_table_state._last_query_time
+    query_interval: float = quote_table_state._query_interval
+
+    # Once its query completes, the thread left behind stops on its own, without
+    # publishing its quotes
+    release.set()
+    query_thread.join(1)
+    assert not query_thread.is_alive()
+    assert quote_table_state.version == version
+    assert quote_table_state.quotes_rows == []
+    assert quote_table_state._last_query_time == last_query_time
+    assert quote_table_state._query_interval == query_interval
+
+
+def test_exiting_context_stops_query_thread() -> None:
+    """Ensure leaving the state's context stops the query thread."""
+
+    with QuoteTableState(FakeYFinance()) as quote_table_state:
+        quote_table_state.query_thread_running = True
+        assert quote_table_state.query_thread_running
+    assert not quote_table_state.query_thread_running
+    assert quote_table_state._query_thread is None
+
+
 ##############################################################################
 # Columns operations tests
 ##############################################################################
@@ -930,3 +1105,46 @@ def test_remove_sorting_column(quote_table_state: QuoteTableState) -> None:
     assert new_version == orig_version + 1
     assert quote_table_state.sort_column_key == QuoteTableState._TICKER_COLUMN_KEY
     assert quote_table_state.sort_column_key == QuoteTableState._TICKER_COLUMN_KEY
+
+
+def test_remove_sorting_column_sorts_on_ticker(
+    quote_table_state: QuoteTableState,
+) -> None:
+    """Ensure the quotes are sorted on the ticker after removing the sorting column."""
+
+    quotes: list[str] = ["^DJI", "AAPL", "F", "VT"]
+    config: dict[str, Any] = {
+        QuoteTableState._COLUMNS: ["last"],
+        QuoteTableState._SORT_COLUMN: "last",
+        QuoteTableState._QUOTES: quotes,
+    }
+    quote_table_state.load_config(config)
+    quote_table_state.remove_column("last")
+    quote_table_state._retrieve_quotes_internal(0)
+
+    rows: list[QuoteRow] = quote_table_state.quotes_rows
+    assert [row.values[0].value for row in rows] == quotes
+
+
+def test_remove_sorting_column_then_flip_direction(
+    quote_table_state: QuoteTableState,
+) -> None:
+    """Ensure the quotes are re-sorted when the sorting column is removed."""
+
+    quotes: list[str] = ["^DJI", "AAPL", "F", "VT"]
+    config: dict[str, Any] = {
+        QuoteTableState._COLUMNS: ["last"],
+        QuoteTableState._SORT_COLUMN: "last",
+        QuoteTableState._QUOTES: quotes,
+    }
+    quote_table_state.load_config(config)
+    quote_table_state._retrieve_quotes_internal(0)
+
+    # No query in between: the removal itself must leave the quotes sorted on ticker
+    quote_table_state.remove_column("last")
+    rows: list[QuoteRow] = quote_table_state.quotes_rows
+    assert [row.values[0].value for row in rows] == quotes
+
+    quote_table_state.sort_direction = SortDirection.DESCENDING
+    rows = quote_table_state.quotes_rows
+    assert [row.values[0].value for row in rows] == quotes[::-1]
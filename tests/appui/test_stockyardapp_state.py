@@ -93,9 +93,8 @@ def test_load_empty_config(stockyard_app_state: StockyardAppState) -> None:
         stockyard_app_state.quote_table_state.sort_direction
         == QuoteTableState._DEFAULT_SORT_DIRECTION
     )
-    assert (
-        stockyard_app_state.quote_table_state._quotes_symbols
-        == QuoteTableState._DEFAULT_QUOTES
+    assert stockyard_app_state.quote_table_state._quotes_symbols == list(
+        QuoteTableState._DEFAULT_QUOTES
     )
     assert (
         stockyard_app_state.quote_table_state.query_frequency
@@ -5,9 +5,16 @@
 
 # pyright: reportPrivateUsage=none
 
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from yfinance import YFinance, YQuote
+from yfinance._yclient import YClient
 
 
 def test_yfinance_connects() -> None:
@@ -28,3 +35,61 @@ def test_yfinance_connects() -> None:
     for q in quotes:
         assert q.symbol in symbols
         symbols.remove(q.symbol)
+
+
+class FakeYClient(YClient):
+    """Fake YClient that answers quote queries from the test data file."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self) -> None:
+        """Initialize the fake YClient."""
+
+        test_data_file = Path(__file__).resolve().parent.parent / "test_data.json"
+        with Path.open(test_data_file, encoding="utf-8") as f:
+            json_data: dict[str, Any] = json.load(f)
+        self._template: dict[str, Any] = json_data["quoteResponse"]["result"][0]
+        self.queried_symbols: list[list[str]] = []
+
+    def call(
+        self,
+        api_url: str,  # noqa: ARG002
+        query_params: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Answer a quote query with a quote for each of the queried symbols.
+
+        Args:
+            api_url (str): The path of the API to call. Unused.
+            query_params (dict[str, str], optional): The query parameters.
+
+        Returns:
+            dict[str, Any]: The JSON response.
+        """
+
+        assert query_params is not None
+        symbols: list[str] = query_params["symbols"].split(",")
+        self.queried_symbols.append(symbols)
+        return {
+            "quoteResponse": {
+                "result": [{**self._template, "symbol": s} for s in symbols],
+                "error": None,
+            }
+        }
+
+
+def test_retrieve_quotes_in_batches() -> None:
+    """Ensure the quotes are queried in batches of bounded size."""
+
+    yf = YFinance()
+    fake_client = FakeYClient()
+    yf._yclient = fake_client
+
+    symbols: list[str] = [f"SYM{i}" for i in range(YFinance._MAX_SYMBOLS_PER_QUERY + 1)]
+    quotes: list[YQuote] = yf.retrieve_quotes(symbols)
+
+    assert [q.symbol for q in quotes] == symbols
+    # The batches are queried concurrently, so they can be queried in any order
+    assert sorted(len(batch) for batch in fake_client.queried_symbols) == [
+        1,
+        YFinance._MAX_SYMBOLS_PER_QUERY,
+    ]